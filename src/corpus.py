@@ -0,0 +1,317 @@
+import mmap
+import os
+import struct
+from heuristics import Heuristics
+
+# file header: magic, version, board size, flags, record size, number of records,
+# followed by the packed goal board the stored depths and heuristic values refer to
+HEADER = struct.Struct("<4sBBBBQ")
+MAGIC = b"PZC1"
+VERSION = 2
+
+# optional per-record fields, one byte each after the packed board
+FLAG_DEPTH = 1
+FLAG_HEURISTICS = 2
+
+# stored for boards whose optimal depth is not known
+UNKNOWN_DEPTH = 255
+
+# byte -> (low nibble, high nibble), used to unpack boards without per-bit work
+_NIBBLES = tuple((byte & 0x0F, byte >> 4) for byte in range(256))
+
+
+def packedBoardSize(size):
+    """
+    Number of bytes of one packed board (4 bits per tile)
+
+    Parameters
+        size: int
+            board dimension (e.g., 3 for 3x3 puzzle)
+
+    Returns: int
+    """
+    return (size * size + 1) // 2
+
+def packBoard(state):
+    """
+    Pack a board into bytes, two tiles per byte (low nibble first)
+
+    Parameters
+        state: tuple[tuple[int]]
+            board configuration with tiles below 16
+
+    Returns: bytes
+    """
+    flat = [tile for row in state for tile in row]
+    if any(not 0 <= tile < 16 for tile in flat):
+        raise ValueError(f"State {state} has tiles that do not fit into 4 bits.")
+    if len(flat) % 2:
+        flat.append(0)
+    return bytes(flat[i] | (flat[i + 1] << 4) for i in range(0, len(flat), 2))
+
+def unpackBoard(data, size):
+    """
+    Unpack a board packed by packBoard
+
+    Parameters
+        data: bytes or memoryview
+            packed board
+        size: int
+            board dimension
+
+    Returns: tuple[tuple[int]]
+    """
+    flat = []
+    for byte in data:
+        flat.extend(_NIBBLES[byte])
+    return tuple(tuple(flat[i: i + size]) for i in range(0, size * size, size))
+
+
+class CorpusWriter:
+    """
+    Writes boards into a binary corpus file
+
+    Every record has the same width: the packed board, then (optional) the optimal depth
+    and (optional) the manhattan and hamming values towards goalState, one byte each.
+    goalState is stored in the header. Use as a context manager, the record count in the
+    header is written on close.
+    """
+
+    def __init__(self, path, goalState=((0, 1, 2), (3, 4, 5), (6, 7, 8)), depths=False, heuristics=False):
+        """
+        Constructor
+
+        Parameters
+        path : str
+            output file, overwritten if it exists
+        goalState : tuple[tuple[int]]
+            goal board, defines the board size and the stored heuristic values
+        depths : bool
+            store the optimal depth of each board
+        heuristics : bool
+            store the manhattan and hamming value of each board
+        """
+        self.size = len(goalState)
+        self.goalState = tuple(tuple(row) for row in goalState)
+        if self.size * self.size > 16:
+            raise ValueError("Corpus boards are packed with 4 bits per tile, at most 4x4 boards are supported.")
+
+        self.flags = (FLAG_DEPTH if depths else 0) | (FLAG_HEURISTICS if heuristics else 0)
+        self.heuristic = Heuristics(goalState) if heuristics else None
+        self.recordSize = packedBoardSize(self.size) + (1 if depths else 0) + (2 if heuristics else 0)
+        self.count = 0
+
+        self.file = open(path, "wb")
+        self._writeHeader()
+
+    def _writeHeader(self):
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, VERSION, self.size, self.flags, self.recordSize, self.count))
+        self.file.write(packBoard(self.goalState))
+
+    def write(self, state, depth=None):
+        """
+        Append one board
+
+        Parameters
+        state : tuple[tuple[int]]
+            board configuration
+        depth : int or None
+            optimal solution length, if known (ignored unless the corpus stores depths)
+        """
+        # records are fixed width, a board of another size would shift every later record
+        if len(state) != self.size or any(len(row) != self.size for row in state):
+            raise ValueError(f"State {state} is not a {self.size}x{self.size} board.")
+        record = bytearray(packBoard(state))
+        if self.flags & FLAG_DEPTH:
+            record.append(UNKNOWN_DEPTH if depth is None else depth)
+        if self.flags & FLAG_HEURISTICS:
+            record.append(self.heuristic.manhattan(state))
+            record.append(self.heuristic.hamming(state))
+        self.file.write(record)
+        self.count += 1
+
+    def close(self):
+        """Write the final record count and close the file"""
+        if not self.file.closed:
+            self._writeHeader()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CorpusReader:
+    """
+    Reads a binary corpus file through a read-only memory map
+
+    Records are only decoded when they are accessed, so iterating over millions of
+    boards needs neither parsing of the whole file nor copies of it. goalState is the
+    goal the stored depths and heuristic values refer to.
+    """
+
+    def __init__(self, path):
+        """
+        Constructor
+
+        Parameters
+        path : str
+            corpus file written by CorpusWriter
+        """
+        self.file = open(path, "rb")
+        try:
+            # mapping an empty file raises, so check the length first
+            if os.fstat(self.file.fileno()).st_size < HEADER.size:
+                raise ValueError(f"{path} is not a puzzle corpus (version {VERSION}).")
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self.file.close()
+            raise
+        self.view = memoryview(self.map)
+
+        magic, version, self.size, self.flags, self.recordSize, self.count = HEADER.unpack_from(self.view)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a puzzle corpus (version {VERSION}).")
+
+        self.boardSize = packedBoardSize(self.size)
+        self.dataOffset = HEADER.size + self.boardSize
+        if self.dataOffset + self.count * self.recordSize > len(self.view):
+            self.close()
+            raise ValueError(f"{path} is truncated.")
+        self.goalState = unpackBoard(self.view[HEADER.size: self.dataOffset], self.size)
+
+        self.hasDepths = bool(self.flags & FLAG_DEPTH)
+        self.hasHeuristics = bool(self.flags & FLAG_HEURISTICS)
+
+    def __len__(self):
+        return self.count
+
+    def rawRecord(self, index):
+        """
+        Zero-copy view of one record
+
+        The view points into the memory map, release it (or drop all references)
+        before closing the reader, otherwise close raises BufferError.
+
+        Parameters
+        index : int
+            record number
+
+        Returns: memoryview
+        """
+        if not 0 <= index < self.count:
+            raise IndexError("corpus index out of range")
+        start = self.dataOffset + index * self.recordSize
+        return self.view[start: start + self.recordSize]
+
+    def __getitem__(self, index):
+        """Board of one record"""
+        return unpackBoard(self.rawRecord(index)[:self.boardSize], self.size)
+
+    def __iter__(self):
+        """Iterate lazily over the boards"""
+        for index in range(self.count):
+            yield self[index]
+
+    def records(self):
+        """
+        Iterate lazily over all records
+
+        Returns: iterator of tuple[tuple[tuple[int]], int or None, int or None, int or None]
+            board, optimal depth, manhattan and hamming value (None if not stored or unknown)
+        """
+        for index in range(self.count):
+            record = self.rawRecord(index)
+            state = unpackBoard(record[:self.boardSize], self.size)
+            offset = self.boardSize
+
+            depth = None
+            if self.hasDepths:
+                depth = record[offset]
+                offset += 1
+                if depth == UNKNOWN_DEPTH:
+                    depth = None
+
+            manhattan = hamming = None
+            if self.hasHeuristics:
+                manhattan = record[offset]
+                hamming = record[offset + 1]
+
+            yield state, depth, manhattan, hamming
+
+    def close(self):
+        """
+        Release the memory map and close the file
+
+        Raises BufferError if views from rawRecord are still alive, the file is closed anyway.
+        """
+        try:
+            self.view.release()
+            self.map.close()
+        finally:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, exc, tb):
+        try:
+            self.close()
+        except BufferError:
+            # do not hide the exception that ended the with block
+            if excType is None:
+                raise
+
+
+def generateCorpus(path, solver, count, depths=False, heuristics=True):
+    """
+    Write count random solvable boards into a corpus file
+
+    Parameters
+        path: str
+            output file
+        solver: Solver
+            used to generate the boards (and to solve them when depths are stored)
+        count: int
+            number of boards
+        depths: bool
+            solve every board with A* (manhattan) and store its optimal depth
+        heuristics: bool
+            store the manhattan and hamming value of each board
+
+    Returns: int (number of boards written)
+    """
+    with CorpusWriter(path, solver.goalState, depths=depths, heuristics=heuristics) as writer:
+        for _ in range(count):
+            state = solver.generateRandomSolvableBoard()
+            depth = None
+            if depths:
+                solution, _ = solver.solve(state, solver.goalState, "manhattan")
+                depth = len(solution) - 1
+            writer.write(state, depth)
+        return writer.count
+
+# TESTING
+if __name__ == "__main__":
+    import tempfile
+    from solver import Solver
+
+    print("Corpus Test")
+    solver = Solver()
+    corpusPath = os.path.join(tempfile.gettempdir(), "test_corpus.pzc")
+
+    written = generateCorpus(corpusPath, solver, 20, depths=True)
+    print(f"Wrote {written} boards ({os.path.getsize(corpusPath)} bytes)")
+
+    with CorpusReader(corpusPath) as reader:
+        for state, depth, manhattan, hamming in reader.records():
+            path, _ = solver.solve(state, solver.goalState, "manhattan")
+            if len(path) - 1 != depth or manhattan != solver.heuristic.manhattan(state):
+                print("TEST FAILED: record does not match board", state)
+        print(f"Read {len(reader)} boards, first: {reader[0]}")
+
+    os.remove(corpusPath)
@@ -0,0 +1,291 @@
+import math
+import numpy as np
+from heuristics import Heuristics
+from solver import flatten
+
+# largest state space the rank-indexed arrays are allowed to cover (9! for the 8-puzzle)
+MAX_RANKS = 10 ** 8
+
+
+class FrontierSolver:
+    """
+    NumPy layer-synchronous 8-Puzzle Solver
+
+    Instead of expanding one node at a time it expands a whole f-layer at once: the layer
+    is a (n, cells) uint8 array of boards, neighbor generation, heuristic scoring and duplicate
+    elimination run vectorized over it. Duplicates are removed by sort/unique on the
+    permutation rank of each board, which also indexes the visited arrays (g, parent, expanded).
+
+    Meant for throughput-heavy work (whole state space, bulk depth labelling, many hard
+    instances) where the per-node Python overhead of Solver.solve is the bottleneck.
+
+    The heuristic must be table based and consistent (one move changes h by at most 1),
+    otherwise f-layers are not expanded in order and the path is not guaranteed optimal.
+    """
+
+    def __init__(self, size=3):
+        """
+        Constructor
+
+        Parameters
+        size: int
+            board dimension, the state space (size*size)! must fit into rank-indexed arrays
+        """
+        self.size = size
+        self.cells = size * size
+        self.numRanks = math.factorial(self.cells)
+        if self.numRanks > MAX_RANKS:
+            raise ValueError(f"A {size}x{size} board has {self.numRanks} states, too many for rank-indexed arrays.")
+
+        # factorial weight of every position for the Lehmer code
+        self.rankWeights = np.array([math.factorial(self.cells - 1 - i) for i in range(self.cells)], dtype=np.int64)
+
+        # moveTargets[blank, direction]: position the blank moves to (up, down, left, right), -1 if off the board
+        self.moveTargets = np.full((self.cells, 4), -1, dtype=np.int64)
+        for position in range(self.cells):
+            row, col = divmod(position, size)
+            for direction, (mr, mc) in enumerate([(-1, 0), (1, 0), (0, -1), (0, 1)]):
+                if 0 <= row + mr < size and 0 <= col + mc < size:
+                    self.moveTargets[position, direction] = (row + mr) * size + col + mc
+
+        # lookup tables per (goalState, heuristic)
+        self._tables = {}
+
+    def rank(self, states):
+        """
+        Permutation rank (Lehmer code) of every board in a layer
+
+        Parameters
+        states: np.ndarray
+            (n, cells) uint8 array of flattened boards
+
+        Returns: np.ndarray
+            (n,) int64 ranks in [0, cells!)
+        """
+        ranks = np.zeros(len(states), dtype=np.int64)
+        for i in range(self.cells - 1):
+            smaller = (states[:, i + 1:] < states[:, i:i + 1]).sum(axis=1)
+            ranks += smaller * self.rankWeights[i]
+        return ranks
+
+    def unrank(self, rank):
+        """
+        Board of a permutation rank
+
+        Parameters
+        rank: int
+
+        Returns: tuple[tuple[int]]
+        """
+        remaining = list(range(self.cells))
+        flat = []
+        for i in range(self.cells):
+            index, rank = divmod(int(rank), int(self.rankWeights[i]))
+            flat.append(remaining.pop(index))
+        return tuple(tuple(flat[i: i + self.size]) for i in range(0, self.cells, self.size))
+
+    def neighbors(self, states):
+        """
+        Generate all neighbors of every board in a layer by sliding the blank (0)
+
+        Parameters
+        states: np.ndarray
+            (n, cells) uint8 array of flattened boards
+
+        Returns: tuple[np.ndarray, np.ndarray]
+            children: (m, cells) uint8 array of neighbor boards
+            parents: (m,) index of the board in states each child was generated from
+        """
+        blank = np.argmin(states, axis=1)
+        children = []
+        parents = []
+        for direction in range(4):
+            target = self.moveTargets[blank, direction]
+            valid = np.nonzero(target >= 0)[0]
+            moved = states[valid]
+            rows = np.arange(len(valid))
+            # swap blank with target tile
+            moved[rows, blank[valid]] = moved[rows, target[valid]]
+            moved[rows, target[valid]] = 0
+            children.append(moved)
+            parents.append(valid)
+        return np.concatenate(children), np.concatenate(parents)
+
+    def _validateState(self, state):
+        """
+        helper to ensure a board is a size x size permutation of 0..cells-1, ranking anything else gives garbage
+        """
+        if len(state) != self.size or any(len(row) != self.size for row in state):
+            raise ValueError(f"State {state} is not a {self.size}x{self.size} board.")
+        if sorted(flatten(state)) != list(range(self.cells)):
+            raise ValueError(f"State {state} does not contain the tiles 0..{self.cells - 1} exactly once.")
+
+    def _table(self, goalState, heuristic):
+        """
+        helper to get the (cells, cells) lookup table of a table-based heuristic as an array
+        """
+        key = (goalState, heuristic)
+        if key not in self._tables:
+            heuristics = Heuristics(goalState)
+            # raises for unknown names
+            heuristics.resolve(heuristic)
+            table = heuristics.table(heuristic)
+            if table is None:
+                raise ValueError(f"Heuristic {heuristic} is not table based, the frontier solver needs a lookup table.")
+            self._tables[key] = np.array(table, dtype=np.int16)
+        return self._tables[key]
+
+    def solve(self, startState, goalState, heuristic):
+        """
+        Solve the puzzle using A* search that expands whole f-layers at once.
+
+        Parameters
+        startState: tuple[tuple[int]]
+            starting board configuration
+        goalState: tuple[tuple[int]]
+            target board configuration
+        heuristic: string
+            name of a table-based, consistent heuristic, e.g. "manhattan" or "hamming"
+
+        Returns: tuple[list[tuple[tuple[int]]], int]
+            path: list[tuple[tuple[int]]]
+                sequence of states from start to goal (None if unsolvable)
+            nodesExpanded: int
+                number of nodes expanded during search
+        """
+        self._validateState(startState)
+        self._validateState(goalState)
+        table = self._table(goalState, heuristic)
+        positions = np.arange(self.cells)
+
+        start = np.array([flatten(startState)], dtype=np.uint8)
+        goalRank = int(self.rank(np.array([flatten(goalState)], dtype=np.uint8))[0])
+
+        # visited arrays indexed by rank
+        bestG = np.full(self.numRanks, -1, dtype=np.int16)
+        parent = np.full(self.numRanks, -1, dtype=np.int64)
+        expanded = np.zeros(self.numRanks, dtype=bool)
+
+        startRank = self.rank(start)
+        bestG[startRank] = 0
+
+        # f -> list of (states, g) layers still to expand
+        buckets = {int(table[positions, start[0]].sum()): [(start, np.zeros(1, dtype=np.int16))]}
+        nodesExpanded = 0
+
+        while buckets:
+            f = min(buckets)
+            layers = buckets.pop(f)
+            states = np.concatenate([layer[0] for layer in layers])
+            g = np.concatenate([layer[1] for layer in layers])
+
+            # expand the f-layer wave by wave, children with the same f form the next wave
+            while len(states):
+                ranks = self.rank(states)
+
+                # drop boards reached more cheaply since, already expanded, or twice in the layer
+                current = (g == bestG[ranks]) & ~expanded[ranks]
+                ranks, first = np.unique(ranks[current], return_index=True)
+                states = states[current][first]
+                g = g[current][first]
+
+                # goal has the smallest f of everything still open = optimal
+                if np.any(ranks == goalRank):
+                    return self._path(parent, goalRank), nodesExpanded
+
+                expanded[ranks] = True
+                nodesExpanded += len(ranks)
+
+                children, parents = self.neighbors(states)
+                childG = g[parents] + 1
+                childRanks = self.rank(children)
+
+                # keep the cheapest copy of every child and only if it improves on what we know
+                order = np.lexsort((childG, childRanks))
+                childRanks, first = np.unique(childRanks[order], return_index=True)
+                keep = order[first]
+                children, parents, childG = children[keep], parents[keep], childG[keep]
+
+                known = bestG[childRanks]
+                better = ~expanded[childRanks] & ((known < 0) | (childG < known))
+                children, childRanks, childG = children[better], childRanks[better], childG[better]
+                bestG[childRanks] = childG
+                parent[childRanks] = ranks[parents[better]]
+
+                childF = childG + table[positions, children].sum(axis=1)
+
+                # consistent heuristic: children never have a smaller f than the layer
+                for value in np.unique(childF[childF != f]):
+                    mask = childF == value
+                    buckets.setdefault(int(value), []).append((children[mask], childG[mask]))
+
+                sameLayer = childF == f
+                states, g = children[sameLayer], childG[sameLayer]
+
+        return None, nodesExpanded
+
+    def _path(self, parent, rank):
+        """
+        helper to follow the parent ranks back to the start and turn them into boards
+        """
+        path = []
+        while rank >= 0:
+            path.append(self.unrank(rank))
+            rank = int(parent[rank])
+        path.reverse()
+        return path
+
+    def depthLabels(self, goalState):
+        """
+        Label every board with its optimal solution length (full-space breadth-first search from the goal)
+
+        Parameters
+        goalState: tuple[tuple[int]]
+            target board configuration
+
+        Returns: np.ndarray
+            (cells!,) int16 array, depth of the board with that rank, -1 for unsolvable boards
+        """
+        self._validateState(goalState)
+        depth = np.full(self.numRanks, -1, dtype=np.int16)
+
+        layer = np.array([flatten(goalState)], dtype=np.uint8)
+        depth[self.rank(layer)] = 0
+        level = 0
+
+        while len(layer):
+            level += 1
+            children, _ = self.neighbors(layer)
+            ranks, first = np.unique(self.rank(children), return_index=True)
+            new = depth[ranks] < 0
+            depth[ranks[new]] = level
+            layer = children[first[new]]
+
+        return depth
+
+# TESTING
+if __name__ == "__main__":
+    import time
+    from solver import Solver
+
+    frontierSolver = FrontierSolver()
+    solver = Solver()
+    goal = solver.goalState
+
+    print("Frontier Solver Test")
+    for i in range(3):
+        board = solver.generateRandomSolvableBoard()
+        for heuristic in ["manhattan", "hamming"]:
+            path, expanded = solver.solve(board, goal, heuristic)
+            layerPath, layerExpanded = frontierSolver.solve(board, goal, heuristic)
+            print(f"Board {i + 1} {heuristic}: A* {len(path) - 1} moves ({expanded} nodes), "
+                  f"frontier {len(layerPath) - 1} moves ({layerExpanded} nodes)")
+            if len(path) != len(layerPath) or layerPath[0] != board or layerPath[-1] != goal:
+                print("TEST FAILED: frontier path is not optimal")
+    print()
+
+    print("Depth Labelling Test")
+    start_time = time.time()
+    depths = frontierSolver.depthLabels(goal)
+    print(f"Labelled {np.count_nonzero(depths >= 0)} solvable boards in {time.time() - start_time:.2f} s, "
+          f"max depth {depths.max()}")
@@ -1,10 +1,12 @@
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, filedialog
 import random
+import threading
 import time
 from datetime import datetime
 from solver import Solver, flatten
 from heuristics import Heuristics
+from search_trace import SearchTrace
 
 
 class SlidePuzzleGUI:
@@ -29,6 +31,18 @@ class SlidePuzzleGUI:
         self.current_step = 0
         self.animation_speed_ms = 300
 
+        # speculative background solving of the current board
+        self.speculation_thread = None
+        self.speculation_cancel = None
+        self.speculation_lock = threading.Lock()
+        self.speculation_results = {}
+
+        # trace of the last solve, every trace_sample_every-th expansion is recorded,
+        # the most recent trace_capacity events are kept
+        self.last_trace = None
+        self.trace_sample_every = 10
+        self.trace_capacity = 4096
+
         self.buttons = []
         self.create_widgets()
         self.shuffle_tiles()
@@ -106,6 +120,13 @@ class SlidePuzzleGUI:
         quit_button = tk.Button(control_frame, text="Quit", command=self.root.quit, font=("Arial", 12), fg="red")
         quit_button.grid(row=6, column=1, padx=5, pady=5, sticky='ew')
 
+        # --- Trace Buttons ---
+        save_trace_button = tk.Button(control_frame, text="Save Trace", command=self.save_trace, font=("Arial", 12))
+        save_trace_button.grid(row=7, column=0, padx=5, pady=5, sticky='ew')
+
+        load_trace_button = tk.Button(control_frame, text="Load Trace", command=self.load_trace, font=("Arial", 12))
+        load_trace_button.grid(row=7, column=1, padx=5, pady=5, sticky='ew')
+
         # --- Log Textbox ---
         log_label = tk.Label(log_frame, text="Activity Log", font=("Arial", 14, "bold"))
         log_label.pack(side=tk.TOP, pady=(0, 5))
@@ -142,6 +163,7 @@ class SlidePuzzleGUI:
 
         self.calculate_heuristics()
         self.log_message("New solvable board generated.")
+        self.start_speculative_solve()
 
     def move_tile(self, i, j):
         """
@@ -162,6 +184,8 @@ class SlidePuzzleGUI:
             self.moves_label.config(text=f"Moves: {self.moves}")
             self.calculate_heuristics()
             self.check_win()
+            # one move away from the last board, so earlier search effort can be reused
+            self.start_speculative_solve(incremental=True)
 
     def check_win(self):
         """Checks if the current state is the goal state."""
@@ -184,6 +208,7 @@ class SlidePuzzleGUI:
         self.current_heuristic = "None"
         self.solution_path = []
         self.current_step = 0
+        self.cancel_speculative_solve()
         self.log_message("Game reset.")
         self.shuffle_tiles()
 
@@ -238,6 +263,62 @@ class SlidePuzzleGUI:
         """Converts a 2D tuple-of-tuples state to the GUI's 1D list state."""
         self.tiles = flatten(state_2d)
 
+    def start_speculative_solve(self, incremental=False):
+        """
+        Starts solving the current board in a background thread for both heuristics,
+        so the result is ready when the user clicks solve. Any previous speculation is cancelled.
+        With incremental=True the solver re-plans from its previous search instead of starting over.
+        """
+        self.cancel_speculative_solve()
+
+        start_state = self.get_current_state_2d()
+        if start_state == self.goalState:
+            return
+
+        cancel_event = threading.Event()
+        self.speculation_cancel = cancel_event
+        self.speculation_thread = threading.Thread(target=self.speculative_solve,
+                                                   args=(start_state, cancel_event, incremental), daemon=True)
+        self.speculation_thread.start()
+
+    def stop_speculative_solve(self):
+        """Stops the running speculation (if any) and waits for it, finished results are kept."""
+        if self.speculation_cancel is not None:
+            self.speculation_cancel.set()
+        if self.speculation_thread is not None:
+            # the search checks the cancel event after every expansion, so this returns quickly
+            self.speculation_thread.join()
+        self.speculation_thread = None
+        self.speculation_cancel = None
+
+    def cancel_speculative_solve(self):
+        """Cancels the running speculation (if any) and drops its results."""
+        self.stop_speculative_solve()
+        with self.speculation_lock:
+            self.speculation_results.clear()
+
+    def speculative_solve(self, start_state, cancel_event, incremental):
+        """
+        Background thread body. Only touches the results cache, never Tk widgets.
+        """
+        for heuristic in ["manhattan", "hamming"]:
+            trace = SearchTrace(capacity=self.trace_capacity, sampleEvery=self.trace_sample_every)
+            solve_start = time.time()
+            if incremental:
+                path, nodes_expanded, stats = self.solver.replan(start_state, self.goalState, heuristic,
+                                                                 cancel_event, trace=trace)
+                mode = stats["mode"]
+            else:
+                path, nodes_expanded = self.solver.solve(start_state, self.goalState, heuristic, cancel_event,
+                                                         trace=trace, remember=True)
+                mode = "fresh"
+            solve_time = time.time() - solve_start
+
+            if cancel_event.is_set():
+                return
+            with self.speculation_lock:
+                self.speculation_results[(start_state, heuristic)] = (path, nodes_expanded, solve_time, mode, trace)
+
     def run_single_benchmark(self, heuristic):
         """
         Runs the full 100-board benchmark using the Solver and logs the results.
@@ -252,6 +333,9 @@ class SlidePuzzleGUI:
 
         self.is_solving = False
 
+        # the background thread would compete for the CPU and skew the runtimes
+        self.cancel_speculative_solve()
+
         try:
             results = self.solver.runBenchmark()
 
@@ -268,6 +352,9 @@ class SlidePuzzleGUI:
             self.log_message(f"Benchmark failed: {e}")
             messagebox.showerror("Benchmark Error", f"Benchmark execution failed: {e}")
 
+        # the remembered searches are untouched by the benchmark, so re-planning is cheap
+        self.start_speculative_solve(incremental=True)
+
         self.is_solving = False
         self.update_buttons()
         self.log_message("--- Benchmark Complete ---")
@@ -292,21 +379,36 @@ class SlidePuzzleGUI:
             self.update_buttons()
             return
 
-        # Start the Search Timer
-        self.start_time = time.time()
-        self.update_timer()
-
         self.current_heuristic = heuristic
 
-        # Run the A* search
-        try:
-            path, nodes_expanded = self.solver.solve(start_state, self.goalState, heuristic)
-        except Exception as e:
-            self.log_message(f"Solver FAILED: {e}")
-            messagebox.showerror("Fatal Error", f"Solver failed: {e}")
-            path = None
+        with self.speculation_lock:
+            speculative = self.speculation_results.get((start_state, heuristic))
 
-        solve_time = time.time() - self.start_time
+        if speculative is not None:
+            # Result was computed in the background, animate right away
+            path, nodes_expanded, solve_time, mode, self.last_trace = speculative
+            self.log_message(f"Using speculative result computed in the background "
+                             f"({mode} search, {nodes_expanded} nodes expanded).")
+        else:
+            # Not ready yet, stop the speculation so it does not compete for the CPU,
+            # results it already finished (e.g. the other heuristic) stay usable
+            self.stop_speculative_solve()
+
+            # Start the Search Timer
+            self.start_time = time.time()
+            self.update_timer()
+
+            # Run the A* search
+            self.last_trace = SearchTrace(capacity=self.trace_capacity, sampleEvery=self.trace_sample_every)
+            try:
+                path, nodes_expanded = self.solver.solve(start_state, self.goalState, heuristic,
+                                                         trace=self.last_trace, remember=True)
+            except Exception as e:
+                self.log_message(f"Solver FAILED: {e}")
+                messagebox.showerror("Fatal Error", f"Solver failed: {e}")
+                path = None
+
+            solve_time = time.time() - self.start_time
 
         # Stop the Search Timer
         self.start_time = None
@@ -332,6 +434,86 @@ class SlidePuzzleGUI:
             self.is_solving = False
             self.update_buttons()
 
+    def save_trace(self):
+        """
+        Saves the trace of the last solve as binary (.pzt) or Chrome trace JSON (.json).
+        """
+        if self.last_trace is None:
+            self.log_message("No trace yet. Solve a board first.")
+            return
+
+        path = filedialog.asksaveasfilename(defaultextension=".pzt",
+                                            filetypes=[("Search trace", "*.pzt"), ("Chrome trace JSON", "*.json")])
+        if not path:
+            return
+
+        try:
+            if path.endswith(".json"):
+                self.last_trace.saveChromeTrace(path)
+            else:
+                self.last_trace.save(path)
+            self.log_message(f"Trace with {len(self.last_trace)} events saved to {path}.")
+        except OSError as e:
+            messagebox.showerror("Trace Error", f"Saving the trace failed: {e}")
+
+    def load_trace(self):
+        """
+        Loads a binary trace and plots f-value and open list size per expansion.
+        """
+        path = filedialog.askopenfilename(filetypes=[("Search trace", "*.pzt")])
+        if not path:
+            return
+
+        try:
+            trace = SearchTrace.load(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Trace Error", f"Loading the trace failed: {e}")
+            return
+
+        self.log_message(f"Loaded trace with {len(trace)} events (every {trace.sampleEvery}. expansion).")
+        self.show_trace_plot(trace)
+
+    def show_trace_plot(self, trace):
+        """
+        Opens a window with line plots of f-value and open list size over the expansions of a trace.
+        """
+        if len(trace) == 0:
+            self.log_message("Trace is empty, nothing to plot.")
+            return
+
+        window = tk.Toplevel(self.root)
+        window.title("Search Trace")
+
+        width, height, margin = 600, 200, 40
+        expansions = trace.column("expansion")
+        x_min, x_max = expansions[0], max(expansions[-1], expansions[0] + 1)
+
+        for column, title, color in [("f", "f-value", "blue"), ("openSize", "Open list size", "green")]:
+            values = trace.column(column)
+            y_min, y_max = min(values), max(max(values), min(values) + 1)
+
+            tk.Label(window, text=f"{title} per expansion", font=("Arial", 12, "bold")).pack(pady=(10, 0))
+            canvas = tk.Canvas(window, width=width, height=height, bg="white")
+            canvas.pack(padx=10, pady=5)
+
+            # axes with min/max labels
+            canvas.create_line(margin, height - margin, width - 10, height - margin)
+            canvas.create_line(margin, 10, margin, height - margin)
+            canvas.create_text(margin - 5, height - margin, text=str(y_min), anchor='e')
+            canvas.create_text(margin - 5, 10, text=str(y_max), anchor='ne')
+            canvas.create_text(margin, height - margin + 5, text=str(x_min), anchor='n')
+            canvas.create_text(width - 10, height - margin + 5, text=str(x_max), anchor='ne')
+
+            points = []
+            for x, y in zip(expansions, values):
+                points.append(margin + (x - x_min) * (width - 10 - margin) / (x_max - x_min))
+                points.append(height - margin - (y - y_min) * (height - margin - 10) / (y_max - y_min))
+
+            if len(points) >= 4:
+                canvas.create_line(*points, fill=color)
+            else:
+                canvas.create_oval(points[0] - 2, points[1] - 2, points[0] + 2, points[1] + 2, fill=color)
+
     def animate_solution(self):
         """
         Displays the solution path on the board one step at a time.
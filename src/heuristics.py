@@ -1,9 +1,56 @@
+from itertools import chain
+from operator import getitem
+
+
 class Heuristics:
     """
     A class for heuristic functions used in the 8-puzzle problem
     Stores goal positions of each tile and computes manhattan/hamming distance
+
+    Heuristics are looked up by name in a registry. Each one is resolved once per goal
+    into a fast callable that skips validation, so solvers can call it for every node.
+    New heuristics are added with register (any callable) or registerTable (additive
+    per-tile costs, evaluated through a lookup table).
     """
 
+    # name -> factory(heuristics) returning a callable(state) -> int
+    registry = {}
+    # name -> cost(tile, position, goalPosition) for additive per-tile heuristics
+    tableCosts = {}
+
+    @classmethod
+    def register(cls, name, factory):
+        """
+        Register a heuristic under a name
+
+        Parameters
+        name : str
+            name used by the solvers (e.g., "manhattan")
+        factory : callable(Heuristics) -> callable(state) -> int
+            builds the heuristic function for one goal state, the function
+            gets valid tuple-of-tuples states only
+        """
+        cls.registry[name] = factory
+        cls.tableCosts.pop(name, None)
+
+    @classmethod
+    def registerTable(cls, name, cost):
+        """
+        Register an additive heuristic that sums a cost per tile
+
+        The solvers close expanded states, so the heuristic should be admissible and
+        consistent (one move changes h by at most 1) to keep solutions optimal;
+        FrontierSolver relies on consistency to expand f-layers in order.
+
+        Parameters
+        name : str
+            name used by the solvers
+        cost : callable(tile, position, goalPosition) -> int
+            cost of a (non-blank) tile at position (row, col) whose goal is goalPosition
+        """
+        cls.register(name, lambda heuristics: heuristics._tableFunction(heuristics.table(name)))
+        cls.tableCosts[name] = cost
+
     def __init__(self, goalState):
         """
         Constructor
@@ -34,6 +81,59 @@ class Heuristics:
                 tile = goalState[row][col]
                 self.goalStatePositions[tile] = (row, col)
 
+        # resolved heuristic functions and lookup tables, built on first use
+        self._resolved = {}
+        self._tables = {}
+
+    def resolve(self, name):
+        """
+        Resolve a heuristic name into a fast function for this goal state (cached)
+
+        Parameters
+        name : str
+            registered heuristic name
+
+        Returns: callable(state) -> int, does not validate the state
+        """
+        function = self._resolved.get(name)
+        if function is None:
+            if name not in self.registry:
+                raise ValueError(f"Unknown heuristic: {name}")
+            function = self.registry[name](self)
+            self._resolved[name] = function
+        return function
+
+    def table(self, name):
+        """
+        Lookup table of an additive heuristic (cached)
+
+        Parameters
+        name : str
+            heuristic registered with registerTable
+
+        Returns: list[list[int]] or None
+            table[position][tile] cost for flattened positions, None if the heuristic is not table based
+        """
+        if name not in self.tableCosts:
+            return None
+        if name not in self._tables:
+            cost = self.tableCosts[name]
+            cells = self.size * self.size
+            self._tables[name] = [
+                [0 if tile == 0 else cost(tile, divmod(position, self.size), self.goalStatePositions[tile])
+                 for tile in range(cells)]
+                for position in range(cells)
+            ]
+        return self._tables[name]
+
+    def _tableFunction(self, table):
+        """
+        helper to build a function that sums table[position][tile] over a tuple-of-tuples state
+        """
+        def function(state):
+            return sum(map(getitem, table, chain.from_iterable(state)))
+        return function
+
     def _validate_state(self, state):
         """
         helper to ensure the given state matches the expected board size
@@ -60,22 +160,7 @@ class Heuristics:
         Time: O(n^2)
         """
         self._validate_state(state)
-
-        # Initialization
-        manhattan = 0
-
-        for row in range(self.size):
-            for col in range(self.size):
-                # getting state number on a position
-                tile = state[row][col]
-
-                if tile != 0:  #self.goalStatePositions[0][0] to specify position regardless of number
-                    # looks up goal coordinates of the tile and afterward separates into Row and Col
-                    goalPosition = self.goalStatePositions[tile]
-                    goalRow = goalPosition[0]
-                    goalCol = goalPosition[1]
-                    manhattan += abs(row - goalRow) + abs(col - goalCol)
-        return manhattan
+        return self.resolve("manhattan")(state)
 
     def hamming(self, state):
         """
@@ -92,20 +177,13 @@ class Heuristics:
         Time: O(n^2)
         """
         self._validate_state(state)
+        return self.resolve("hamming")(state)
 
-        # Initialization
-        hamming = 0
-
-        for row in range(self.size):
-            for col in range(self.size):
-                # getting IS-number of current row/col
-                tile = state[row][col]
-
-                if tile != 0:
-                    # looking if SHOULD-Position of current tile is current row/col
-                    if self.goalStatePositions[tile] != (row, col):
-                        hamming += 1
-        return hamming
+# sum of absolute row + column differences between each tile and its goal position
+Heuristics.registerTable("manhattan", lambda tile, position, goalPosition:
+                         abs(position[0] - goalPosition[0]) + abs(position[1] - goalPosition[1]))
+# 1 for every tile that is not in its goal position
+Heuristics.registerTable("hamming", lambda tile, position, goalPosition: int(position != goalPosition))
 
 # TESTING
 if __name__ == "__main__":
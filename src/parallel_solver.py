@@ -0,0 +1,360 @@
+import heapq
+import multiprocessing as mp
+import os
+import queue
+import random
+import time
+import traceback
+from heuristics import Heuristics
+from solver import Solver
+
+# helper to build a Zobrist table for a size x size board
+def zobristTable(size, seed=0):
+    """
+    Build a Zobrist table with one random 64-bit key per (position, tile)
+
+    Parameters
+        size: int
+            board dimension (e.g., 3 for 3x3 puzzle)
+        seed: int
+            seed for the random generator, so every process builds the same table
+
+    Returns: list[list[int]]
+        table[position][tile] random keys
+    """
+    rng = random.Random(seed)
+    cells = size * size
+    return [[rng.getrandbits(64) for _ in range(cells)] for _ in range(cells)]
+
+def zobristHash(state, table):
+    """
+    Hash a board by XOR-ing the Zobrist keys of every (position, tile) pair
+
+    Parameters
+        state: tuple[tuple[int]]
+            current board configuration
+        table: list[list[int]]
+            Zobrist table from zobristTable
+
+    Returns: int (64-bit hash)
+    """
+    h = 0
+    position = 0
+    for row in state:
+        for tile in row:
+            h ^= table[position][tile]
+            position += 1
+    return h
+
+
+def _worker(workerId, numWorkers, goalState, heuristicTable, heuristicFactory, zobrist, inboxes, control, results,
+            expansionsPerRound, batchSize):
+    """
+    HDA* worker process
+
+    Runs _runWorker and reports any exception to the coordinator as ("error", workerId, traceback)
+    instead of dying silently.
+    """
+    try:
+        _runWorker(workerId, numWorkers, goalState, heuristicTable, heuristicFactory, zobrist, inboxes, control,
+                   results, expansionsPerRound, batchSize)
+    except Exception:
+        results.put(("error", workerId, traceback.format_exc()))
+
+def _runWorker(workerId, numWorkers, goalState, heuristicTable, heuristicFactory, zobrist, inboxes, control, results,
+               expansionsPerRound, batchSize):
+    """
+    Owns every state whose Zobrist hash maps to workerId. Works in rounds driven by
+    the coordinator: receive the announced number of batches, expand up to
+    expansionsPerRound nodes with f below the incumbent, send the generated nodes
+    to their owners in batches and report back.
+
+    The heuristic arrives as lookup table or factory, because a worker started with
+    "spawn" does not see heuristics registered at runtime in the parent.
+    """
+    solver = Solver()
+    solver.size = len(goalState)
+    solver.goalState = goalState
+    solver.heuristic = Heuristics(goalState)
+    if heuristicTable is not None:
+        estimate = solver.heuristic._tableFunction(heuristicTable)
+    else:
+        estimate = heuristicFactory(solver.heuristic)
+
+    # priority queue: stores (f, g, state), gScore/parent only for owned states
+    openList = []
+    gScore = {}
+    parent = {}
+
+    stats = {
+        "worker": workerId,
+        "nodesExpanded": 0,
+        "nodesSent": 0,
+        "nodesReceived": 0,
+        "batchesSent": 0,
+        "batchesReceived": 0,
+        "communicationTime": 0.0,
+    }
+
+    def insert(state, g, parentState):
+        # keep only the cheapest known path to an owned state (re-opens on improvement)
+        if g < gScore.get(state, float("inf")):
+            gScore[state] = g
+            parent[state] = parentState
+            heapq.heappush(openList, (g + estimate(state), g, state))
+
+    while True:
+        command = control.get()
+
+        if command[0] == "stop":
+            results.put(stats)
+            return
+
+        if command[0] == "parent":
+            results.put(parent.get(command[1]))
+            continue
+
+        _, incumbent, expectedBatches = command
+
+        # receive all batches the coordinator announced for this round
+        start = time.perf_counter()
+        for _ in range(expectedBatches):
+            batch = inboxes[workerId].get()
+            stats["batchesReceived"] += 1
+            stats["nodesReceived"] += len(batch)
+            for state, g, parentState in batch:
+                insert(state, g, parentState)
+        stats["communicationTime"] += time.perf_counter() - start
+
+        outgoing = [[] for _ in range(numWorkers)]
+        expanded = 0
+        goalCost = None
+
+        while openList and expanded < expansionsPerRound:
+            f, g, currentState = heapq.heappop(openList)
+
+            # stale entry, a cheaper path was found after this one was pushed
+            if g > gScore[currentState]:
+                continue
+
+            # nothing left here can beat the incumbent solution
+            if f >= incumbent:
+                heapq.heappush(openList, (f, g, currentState))
+                break
+
+            # goal reached = new incumbent, but other workers may still hold cheaper nodes
+            if currentState == goalState:
+                goalCost = g
+                incumbent = g
+                continue
+
+            expanded += 1
+
+            for neighbor in solver.neighbors(currentState):
+                owner = zobristHash(neighbor, zobrist) % numWorkers
+                if owner == workerId:
+                    insert(neighbor, g + 1, currentState)
+                else:
+                    outgoing[owner].append((neighbor, g + 1, currentState))
+
+        stats["nodesExpanded"] += expanded
+
+        # send generated nodes to their owners in batches
+        start = time.perf_counter()
+        sentBatches = [0] * numWorkers
+        for destination, nodes in enumerate(outgoing):
+            for i in range(0, len(nodes), batchSize):
+                inboxes[destination].put(nodes[i: i + batchSize])
+                sentBatches[destination] += 1
+            stats["nodesSent"] += len(nodes)
+        stats["batchesSent"] += sum(sentBatches)
+        stats["communicationTime"] += time.perf_counter() - start
+
+        # smallest f still open (may be stale, which only delays termination by a round)
+        minF = openList[0][0] if openList else None
+        results.put((workerId, sentBatches, goalCost, minF))
+
+
+class ParallelSolver(Solver):
+    """
+    Hash-distributed parallel A* (HDA*) 8-Puzzle Solver
+
+    Every state is owned by one worker process chosen by its Zobrist hash. Workers
+    expand their own open lists and exchange generated nodes in batches through
+    queues. A coordinator runs the search in synchronous rounds, which makes
+    optimal termination exact: the search stops once no batches are in flight and
+    no worker holds an open node with f below the best solution found.
+
+    Process start-up and queue traffic dominate on easy 8-puzzle instances; the
+    mode pays off on deep instances and larger boards.
+
+    Table-based heuristics are sent to the workers as lookup tables. Other heuristics
+    are sent as their registered factory, which must be picklable (a module-level
+    function, not a lambda) on platforms that start processes with "spawn".
+    """
+
+    def __init__(self, numWorkers=None, batchSize=64, expansionsPerRound=256, workerTimeout=1.0):
+        """
+        Constructor
+
+        Parameters
+        numWorkers: int or None
+            number of worker processes (defaults to the number of CPUs)
+        batchSize: int
+            maximum number of nodes per message between workers
+        expansionsPerRound: int
+            maximum number of expansions per worker between two synchronizations
+        workerTimeout: float
+            seconds between liveness checks of a worker while waiting for its answer
+        """
+        super().__init__()
+        self.workerTimeout = workerTimeout
+        self.numWorkers = numWorkers or os.cpu_count() or 1
+        self.batchSize = batchSize
+        self.expansionsPerRound = expansionsPerRound
+
+    def solveParallel(self, startState, goalState, heuristic):
+        """
+        Solve the puzzle using hash-distributed parallel A* search.
+
+        Parameters
+        startState: tuple[tuple[int]]
+            starting board configuration
+        goalState: tuple[tuple[int]]
+            target board configuration
+        heuristic: string
+            name of a registered heuristic, e.g. "manhattan" or "hamming"
+
+        Returns: tuple[list[tuple[tuple[int]]], int, dict]
+            path: list[tuple[tuple[int]]]
+                sequence of states from start to goal (None if unsolvable)
+            nodesExpanded: int
+                number of nodes expanded by all workers together
+            stats: dict
+                per-worker expansions and communication overhead, number of rounds
+        """
+        # validate once here, so an unknown heuristic fails before any process starts
+        self.resolveHeuristic(heuristic, startState, goalState)
+        heuristicTable = Heuristics(goalState).table(heuristic)
+        heuristicFactory = Heuristics.registry[heuristic] if heuristicTable is None else None
+        numWorkers = self.numWorkers
+        zobrist = zobristTable(len(goalState))
+
+        inboxes = [mp.Queue() for _ in range(numWorkers)]
+        controls = [mp.Queue() for _ in range(numWorkers)]
+        results = [mp.Queue() for _ in range(numWorkers)]
+
+        workers = [
+            mp.Process(target=_worker,
+                       args=(i, numWorkers, goalState, heuristicTable, heuristicFactory, zobrist, inboxes,
+                             controls[i], results[i], self.expansionsPerRound, self.batchSize),
+                       daemon=True)
+            for i in range(numWorkers)
+        ]
+        def receive(i):
+            # wait for worker i, but fail instead of hanging if it died or reported an error
+            while True:
+                try:
+                    message = results[i].get(timeout=self.workerTimeout)
+                except queue.Empty:
+                    if not workers[i].is_alive():
+                        raise RuntimeError(f"HDA* worker {i} died (exit code {workers[i].exitcode})")
+                    continue
+                if isinstance(message, tuple) and message and message[0] == "error":
+                    raise RuntimeError(f"HDA* worker {i} failed:\n{message[2]}")
+                return message
+
+        try:
+            for worker in workers:
+                worker.start()
+
+            # the start node is sent to its owner like any other node
+            startOwner = zobristHash(startState, zobrist) % numWorkers
+            inboxes[startOwner].put([(startState, 0, None)])
+            expected = [0] * numWorkers
+            expected[startOwner] = 1
+
+            incumbent = float("inf")
+            rounds = 0
+
+            while True:
+                rounds += 1
+                for i in range(numWorkers):
+                    controls[i].put(("round", incumbent, expected[i]))
+
+                expected = [0] * numWorkers
+                minFs = []
+                for i in range(numWorkers):
+                    _, sentBatches, goalCost, minF = receive(i)
+                    for destination, count in enumerate(sentBatches):
+                        expected[destination] += count
+                    if goalCost is not None and goalCost < incumbent:
+                        incumbent = goalCost
+                    minFs.append(minF)
+
+                # optimal once nothing is in flight and nothing open can beat the incumbent
+                if sum(expected) == 0 and all(minF is None or minF >= incumbent for minF in minFs):
+                    break
+
+            path = None
+            if incumbent != float("inf"):
+                # walk the parent pointers back through the owning workers
+                path = [goalState]
+                while True:
+                    owner = zobristHash(path[-1], zobrist) % numWorkers
+                    controls[owner].put(("parent", path[-1]))
+                    parentState = receive(owner)
+                    if parentState is None:
+                        break
+                    path.append(parentState)
+                path.reverse()
+
+            for i in range(numWorkers):
+                controls[i].put(("stop",))
+            workerStats = [receive(i) for i in range(numWorkers)]
+        finally:
+            for worker in workers:
+                if worker.pid is None:
+                    continue
+                worker.join(timeout=1)
+                if worker.is_alive():
+                    worker.terminate()
+                    worker.join()
+            # release the queues' pipes and semaphores, undelivered batches are not needed anymore
+            for q in inboxes + controls + results:
+                q.cancel_join_thread()
+                q.close()
+
+        nodesExpanded = sum(s["nodesExpanded"] for s in workerStats)
+        stats = {
+            "rounds": rounds,
+            "workers": workerStats,
+            "nodesSent": sum(s["nodesSent"] for s in workerStats),
+            "batchesSent": sum(s["batchesSent"] for s in workerStats),
+            "communicationTime": sum(s["communicationTime"] for s in workerStats),
+        }
+        return path, nodesExpanded, stats
+
+# TESTING
+if __name__ == "__main__":
+
+    solver = ParallelSolver(numWorkers=4)
+
+    print("HDA* Solver Test")
+    start = ((8, 6, 7),
+             (2, 5, 4),
+             (3, 0, 1))
+    goal = solver.goalState
+
+    for heuristic in ["manhattan", "hamming"]:
+        path, expanded = solver.solve(start, goal, heuristic)
+        parallelPath, parallelExpanded, stats = solver.solveParallel(start, goal, heuristic)
+        print(f"{heuristic}: A* {len(path) - 1} moves ({expanded} nodes), "
+              f"HDA* {len(parallelPath) - 1} moves ({parallelExpanded} nodes, {stats['rounds']} rounds)")
+        for workerStats in stats["workers"]:
+            print(f"  worker {workerStats['worker']}: expanded {workerStats['nodesExpanded']}, "
+                  f"sent {workerStats['nodesSent']} nodes in {workerStats['batchesSent']} batches, "
+                  f"communication {workerStats['communicationTime']:.4f} s")
+
+        if len(path) != len(parallelPath):
+            print("TEST FAILED: HDA* path is not optimal")
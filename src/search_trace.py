@@ -0,0 +1,187 @@
+import json
+import struct
+import sys
+import time
+from array import array
+
+# file header: magic, version, sampleEvery, number of events
+HEADER = struct.Struct("<4sBIQ")
+MAGIC = b"PZT1"
+VERSION = 1
+
+
+class SearchTrace:
+    """
+    Sampled record of the expansions of one search
+
+    Events are written into preallocated typed arrays used as a ring buffer, so recording
+    never allocates and a long search keeps its most recent events. Only every
+    sampleEvery-th expansion is recorded, which keeps the overhead tunable.
+    A trace is exported as compact binary (load with SearchTrace.load) or as Chrome trace
+    JSON for chrome://tracing / Perfetto.
+    """
+
+    # column name -> array typecode
+    FIELDS = (("expansion", "q"), ("f", "i"), ("g", "i"), ("h", "i"), ("openSize", "q"), ("timestamp", "q"))
+
+    def __init__(self, capacity=100000, sampleEvery=1):
+        """
+        Constructor
+
+        Parameters
+        capacity : int
+            maximum number of events kept, older events are overwritten
+        sampleEvery : int
+            record every n-th expansion only
+        """
+        if capacity < 1:
+            raise ValueError(f"Trace capacity must be at least 1, got {capacity}.")
+        self.capacity = capacity
+        self.sampleEvery = sampleEvery
+        self.columns = {name: array(typecode, bytes(array(typecode).itemsize * capacity))
+                        for name, typecode in self.FIELDS}
+        # number of events ever recorded, the ring position is count % capacity
+        self.count = 0
+        self.startTime = time.perf_counter_ns()
+
+    def record(self, expansion, f, g, h, openSize):
+        """
+        Store one expansion event (the caller checks sampleEvery to skip the call altogether)
+
+        Parameters
+        expansion : int
+            number of nodes expanded so far
+        f, g, h : int
+            costs of the expanded node
+        openSize : int
+            number of entries in the open list
+        """
+        i = self.count % self.capacity
+        columns = self.columns
+        columns["expansion"][i] = expansion
+        columns["f"][i] = f
+        columns["g"][i] = g
+        columns["h"][i] = h
+        columns["openSize"][i] = openSize
+        columns["timestamp"][i] = time.perf_counter_ns() - self.startTime
+        self.count += 1
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def column(self, name):
+        """
+        Recorded values of one field in chronological order
+
+        Parameters
+        name : str
+            one of "expansion", "f", "g", "h", "openSize", "timestamp" (nanoseconds since start)
+
+        Returns: array.array
+        """
+        values = self.columns[name]
+        if self.count <= self.capacity:
+            return values[:self.count]
+        split = self.count % self.capacity
+        return values[split:] + values[:split]
+
+    def save(self, path):
+        """
+        Export the trace in the compact binary format (little-endian columns)
+
+        Parameters
+        path : str
+            output file
+        """
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, self.sampleEvery, len(self)))
+            for name, _ in self.FIELDS:
+                values = self.column(name)
+                if sys.byteorder == "big":
+                    values.byteswap()
+                file.write(values.tobytes())
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a trace written by save
+
+        Parameters
+        path : str
+            binary trace file
+
+        Returns: SearchTrace
+        """
+        with open(path, "rb") as file:
+            header = file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f"{path} is not a search trace (version {VERSION}).")
+            magic, version, sampleEvery, count = HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a search trace (version {VERSION}).")
+
+            trace = cls(capacity=max(count, 1), sampleEvery=sampleEvery)
+            for name, typecode in cls.FIELDS:
+                values = array(typecode)
+                values.frombytes(file.read(values.itemsize * count))
+                if len(values) != count:
+                    raise ValueError(f"{path} is truncated.")
+                if sys.byteorder == "big":
+                    values.byteswap()
+                trace.columns[name][:count] = values
+            trace.count = count
+        return trace
+
+    def saveChromeTrace(self, path):
+        """
+        Export the trace as Chrome trace JSON (counter events, one per recorded expansion)
+
+        Parameters
+        path : str
+            output file
+        """
+        columns = {name: self.column(name) for name, _ in self.FIELDS}
+        events = [
+            {
+                "name": "search",
+                "ph": "C",
+                "ts": columns["timestamp"][i] / 1000,
+                "pid": 1,
+                "tid": 1,
+                "args": {"f": columns["f"][i], "g": columns["g"][i], "h": columns["h"][i],
+                         "openSize": columns["openSize"][i]},
+            }
+            for i in range(len(self))
+        ]
+        with open(path, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+
+# TESTING
+if __name__ == "__main__":
+    import os
+    import tempfile
+    from solver import Solver
+
+    print("Search Trace Test")
+    solver = Solver()
+    start = ((8, 6, 7),
+             (2, 5, 4),
+             (3, 0, 1))
+
+    trace = SearchTrace(capacity=1000, sampleEvery=10)
+    path, expanded = solver.solve(start, solver.goalState, "manhattan", trace=trace)
+    print(f"Expanded {expanded} nodes, recorded {trace.count} events, kept {len(trace)}")
+    print("Last f-values:", list(trace.column("f")[-5:]))
+
+    tracePath = os.path.join(tempfile.gettempdir(), "test_trace.pzt")
+    trace.save(tracePath)
+    loaded = SearchTrace.load(tracePath)
+    if loaded.column("openSize") != trace.column("openSize"):
+        print("TEST FAILED: loaded trace differs")
+    print(f"Binary trace: {os.path.getsize(tracePath)} bytes")
+
+    trace.saveChromeTrace(tracePath + ".json")
+    print(f"Chrome trace: {os.path.getsize(tracePath + '.json')} bytes")
+
+    os.remove(tracePath)
+    os.remove(tracePath + ".json")
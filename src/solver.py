@@ -2,8 +2,12 @@ import heapq
 import random
 import time
 import statistics
+import sys
+import tracemalloc
+from contextlib import nullcontext
 from datetime import datetime
 from heuristics import Heuristics
+from corpus import CorpusReader
 
 # helper to flatten 2D board to 1D
 def flatten(state):
@@ -18,6 +22,25 @@ def flatten(state):
     """
     return [tile for row in state for tile in row]
 
+class _MemoryNode:
+    """
+    Search tree node used by Solver.solveMemoryBounded
+
+    f starts as g + h and is later raised to the smallest f of its children (backed-up value)
+    forgotten is a bitmask of the pruned children (by successor index) that had been expanded, to count re-expansions
+    """
+    __slots__ = ("state", "g", "f", "parent", "children", "alive", "expandedBefore", "forgotten")
+
+    def __init__(self, state, g, h, parent):
+        self.state = state
+        self.g = g
+        self.f = g + h
+        self.parent = parent
+        self.children = []
+        self.alive = True
+        self.expandedBefore = False
+        self.forgotten = 0
+
 class Solver:
     """
     A* 8-Puzzle Solver
@@ -35,6 +58,10 @@ class Solver:
         self.size = 3
         self.goalState = ((0,1,2), (3,4,5), (6,7,8))
         self.heuristic = Heuristics(self.goalState)
+        # remembered searches per (goalState, heuristic), used by replan
+        self.searchCache = {}
+        # a cache that would grow past this many bounds restarts from the latest search
+        self.searchCacheLimit = 500000
 
     def generateRandomSolvableBoard(self):
         """
@@ -149,24 +176,36 @@ class Solver:
         g: int
             cost of moves so far
         heuristic: string
-            which heuristic to use: "manhattan" or "hamming"
+            name of a registered heuristic, e.g. "manhattan" or "hamming"
 
         Returns: f, g, h - tuple[int, int, int]
             f = total estimated cost
             g = path cost so far
             h = heuristic estimate
         """
-
-        if heuristic == "manhattan":
-            h = self.heuristic.manhattan(state)
-        elif heuristic == "hamming":
-            h = self.heuristic.hamming(state)
-        else:
-            raise ValueError(f"Unknown heuristic: {heuristic}")
+        h = self.heuristic.resolve(heuristic)(state)
 
         return g + h, g, h
 
-    def solve(self, startState, goalState, heuristic):
+    def resolveHeuristic(self, heuristic, *states):
+        """
+        Validate the given states once and resolve the heuristic into a fast function.
+        Searches call this at their entry point, so the per-node work skips validation and name lookup.
+
+        Parameters
+        heuristic: string
+            name of a registered heuristic, e.g. "manhattan" or "hamming"
+        states: tuple[tuple[int]]
+            boards passed in by the caller (start and goal)
+
+        Returns: callable(state) -> int
+            heuristic estimate from state to goal
+        """
+        for state in states:
+            self.heuristic._validate_state(state)
+        return self.heuristic.resolve(heuristic)
+
+    def solve(self, startState, goalState, heuristic, cancelEvent=None, trace=None, remember=False):
         """
         Solve the 8-puzzle using A* search.
 
@@ -176,60 +215,429 @@ class Solver:
         goalState: tuple[tuple[int]]
             target board configuration
         heuristic: string
-            which heuristic to use: "manhattan" or "hamming"
+            name of a registered heuristic, e.g. "manhattan" or "hamming"
+        cancelEvent: threading.Event or None
+            optional event, the search gives up as soon as it is set
+        trace: SearchTrace or None
+            optional trace that records every trace.sampleEvery-th expansion
+        remember: bool
+            keep the search (all expanded states) in searchCache so that replan can answer
+            nearby start states incrementally, off by default to keep solve stateless
 
         Returns: tuple[list[tuple[tuple[int]]], int]
             path: list[tuple[tuple[int]]]
-                sequence of states from start to goal
+                sequence of states from start to goal (None if cancelled)
             nodesExpanded: int
                 number of nodes expanded during search
         """
+        path, nodesExpanded, closedG = self._search(startState, goalState, heuristic, cancelEvent, trace=trace)
+
+        if remember and path is not None:
+            # a fresh solve starts a new cache for this goal and heuristic,
+            # the bounds are only built once replan needs them
+            self.searchCache[(goalState, heuristic)] = {"path": path, "closedG": closedG}
+
+        return path, nodesExpanded
+
+    def replan(self, startState, goalState, heuristic, cancelEvent=None, compareFresh=False, trace=None):
+        """
+        Solve the 8-puzzle incrementally, reusing the effort of earlier searches to the same goal
+        (earlier replans and solves with remember=True).
+
+        If startState lies on a known optimal path the remaining path is returned without search.
+        Otherwise A* runs with the heuristic raised to the cached lower bounds C* - g(s) of all
+        previously expanded states (Adaptive A*), and stops as soon as it reaches a state on a
+        known optimal path.
+
+        Parameters
+        startState: tuple[tuple[int]]
+            starting board configuration
+        goalState: tuple[tuple[int]]
+            target board configuration
+        heuristic: string
+            name of a registered heuristic, e.g. "manhattan" or "hamming"
+        cancelEvent: threading.Event or None
+            optional event, the search gives up as soon as it is set
+        compareFresh: bool
+            also run a fresh search to report the saved expansions (doubles the work)
+        trace: SearchTrace or None
+            optional trace that records every trace.sampleEvery-th expansion
+
+        Returns: tuple[list[tuple[tuple[int]]], int, dict]
+            path: list[tuple[tuple[int]]]
+                sequence of states from start to goal (None if cancelled)
+            nodesExpanded: int
+                number of nodes expanded during search
+            stats: dict
+                mode ("path", "replan" or "fresh"), freshExpansions and savedExpansions
+                (None unless compareFresh is set)
+        """
+        self.resolveHeuristic(heuristic, startState, goalState)
+        cache = self.searchCache.get((goalState, heuristic))
+        if cache is not None and "next" not in cache:
+            cache = self._rememberSearch(None, cache["path"], cache["closedG"])
+            self.searchCache[(goalState, heuristic)] = cache
+
+        if cache is None:
+            mode = "fresh"
+            path, nodesExpanded, closedG = self._search(startState, goalState, heuristic, cancelEvent, trace=trace)
+        elif startState in cache["next"]:
+            # still on a known optimal path, answer immediately, the cache already knows it
+            path = self._knownPath(cache, startState)
+            stats = {"mode": "path", "nodesExpanded": 0, "freshExpansions": None, "savedExpansions": None}
+            if compareFresh:
+                _, freshExpansions, _ = self._search(startState, goalState, heuristic, cancelEvent)
+                stats["freshExpansions"] = freshExpansions
+                stats["savedExpansions"] = freshExpansions
+            return path, 0, stats
+        else:
+            mode = "replan"
+            path, nodesExpanded, closedG = self._search(startState, goalState, heuristic, cancelEvent, cache, trace)
+
+        stats = {"mode": mode, "nodesExpanded": nodesExpanded, "freshExpansions": None, "savedExpansions": None}
+
+        if path is None:
+            return None, nodesExpanded, stats
+
+        self.searchCache[(goalState, heuristic)] = self._rememberSearch(cache, path, closedG)
+
+        if compareFresh:
+            _, freshExpansions, _ = self._search(startState, goalState, heuristic, cancelEvent)
+            stats["freshExpansions"] = freshExpansions
+            stats["savedExpansions"] = freshExpansions - nodesExpanded
+
+        return path, nodesExpanded, stats
+
+    def _search(self, startState, goalState, heuristic, cancelEvent=None, cache=None, trace=None):
+        """
+        A* search core shared by solve and replan.
+
+        With a cache the heuristic is raised to the cached lower bounds and the search
+        finishes early at any state on a known optimal path. With a trace every
+        trace.sampleEvery-th expansion is recorded.
+
+        Returns: tuple[list[tuple[tuple[int]]], int, dict]
+            path, nodesExpanded and the g-value of every expanded state
+        """
+        bounds = cache["bounds"] if cache is not None else {}
+        nextState = cache["next"] if cache is not None else {}
 
         # priority queue: stores (f, g, state, path)
         openList = []
-        # all states we've already visited, without duplicates
-        closedSet = set()
+        # all states we've already expanded with their g-value, without duplicates
+        closedG = {}
+
+        estimate = self.resolveHeuristic(heuristic, startState, goalState)
 
         # initial costs
-        f, g, h = self.calculateCosts(startState, g=0, heuristic=heuristic)
+        g = 0
+        f = g + estimate(startState)
         # push starting node into the openList
         heapq.heappush(openList, (f, g, startState, [startState]))
 
         nodesExpanded = 0
+        sampleEvery = trace.sampleEvery if trace is not None else 0
 
         # as long as there are nodes to explore
         while openList:
+            # stop early if the caller no longer needs the result
+            if cancelEvent is not None and cancelEvent.is_set():
+                return None, nodesExpanded, closedG
+
             # get state info with smallest f
             f, g, currentState, path = heapq.heappop(openList)
 
             # if goal reached = done
             if currentState == goalState:
-                return path, nodesExpanded
+                return path, nodesExpanded, closedG
+
+            # on a known optimal path its cached bound is exact, so f is optimal here
+            if currentState in nextState:
+                return path + self._knownPath(cache, currentState)[1:], nodesExpanded, closedG
 
             # avoid re-expanding
-            if currentState in closedSet:
+            if currentState in closedG:
                 continue
-            closedSet.add(currentState)
+            closedG[currentState] = g
 
             nodesExpanded += 1
+            if sampleEvery and nodesExpanded % sampleEvery == 0:
+                trace.record(nodesExpanded, f, g, f - g, len(openList))
 
             # generate neighbors
             for neighbor in self.neighbors(currentState):
-                if neighbor not in closedSet:
+                if neighbor not in closedG:
                     new_g = g + 1
-                    # we just need f so we don't care about g and h
-                    f, _, _ = self.calculateCosts(neighbor, new_g, heuristic)
+                    h = estimate(neighbor)
+                    f = new_g + h
+                    if bounds:
+                        f = new_g + max(h, bounds.get(neighbor, 0))
                     heapq.heappush(openList, (f, new_g, neighbor, path + [neighbor]))
 
-        return None, nodesExpanded
+        return None, nodesExpanded, closedG
 
+    def _rememberSearch(self, cache, path, closedG):
+        """
+        Merge a finished search into a (new) cache for its goal and heuristic.
+
+        cache["bounds"] maps expanded states to the admissible bound C* - g(s),
+        cache["next"] maps states on known optimal paths to their successor.
+        The old cache is returned unchanged if the search taught nothing new, and dropped
+        if the merged cache would grow past searchCacheLimit.
+        """
+        if cache is not None and len(cache["bounds"]) + len(closedG) > self.searchCacheLimit:
+            cache = None
+        bounds = cache["bounds"] if cache is not None else {}
+        nextState = cache["next"] if cache is not None else {}
+
+        cost = len(path) - 1
+        newBounds = {state: cost - g for state, g in closedG.items() if cost - g > bounds.get(state, 0)}
+
+        # every state on an optimal path is exactly (cost - index) moves from the goal
+        newNext = {}
+        for i, state in enumerate(path):
+            if state not in nextState:
+                newBounds[state] = cost - i
+                newNext[state] = path[i + 1] if i < cost else None
+
+        if cache is not None and not newBounds and not newNext:
+            return cache
+
+        # copied and replaced as a whole so background threads always see a consistent cache
+        return {"bounds": {**bounds, **newBounds}, "next": {**nextState, **newNext}}
+
+    def _knownPath(self, cache, state):
+        """Follow the cached successors from state to the goal."""
+        path = [state]
+        while cache["next"][path[-1]] is not None:
+            path.append(cache["next"][path[-1]])
+        return path
+
+
+    def solveMemoryBounded(self, startState, goalState, heuristic, maxNodes=None, maxBytes=None):
+        """
+        Solve the 8-puzzle using memory-bounded A* search (SMA*-style).
+
+        The search tree never holds more than maxNodes nodes. When it is full, the worst
+        subtree (highest f, all children are leaves) is pruned and the children's f-values
+        stay backed up in the parent, which becomes a leaf again and is regenerated once it
+        is the most promising leaf. The solution is optimal whenever the budget can hold the
+        optimal path together with the siblings along it.
+
+        Parameters
+        startState: tuple[tuple[int]]
+            starting board configuration
+        goalState: tuple[tuple[int]]
+            target board configuration
+        heuristic: string
+            name of a registered heuristic, e.g. "manhattan" or "hamming"
+        maxNodes: int or None
+            maximum number of tree nodes kept in memory
+        maxBytes: int or None
+            memory budget in bytes for the search tree and its queues, converted to a node budget
+            with the estimated size per node (see _memoryNodeBytes), fixed interpreter overhead excluded
+
+        Returns: tuple[list[tuple[tuple[int]]], int, dict]
+            path: list[tuple[tuple[int]]]
+                sequence of states from start to goal (None if the budget is too small)
+            nodesExpanded: int
+                number of nodes expanded during search (including re-expansions)
+            stats: dict
+                maxNodes, peakNodes, reExpansions and prunes (number of pruned subtrees)
+        """
+        if maxBytes is not None:
+            byteBudget = max(1, maxBytes // self._memoryNodeBytes(startState))
+            maxNodes = byteBudget if maxNodes is None else min(maxNodes, byteBudget)
+        if maxNodes is None:
+            maxNodes = float("inf")
+
+        infinity = float("inf")
+
+        # lazy priority queues, an entry is only valid while it still matches its node
+        # leaves: (f, -g, counter, node) -> smallest f first, deeper first
+        # prunable: (-f, g, counter, node) -> largest f first, shallower first
+        leaves = []
+        prunable = []
+        counter = 0
+
+        def pushLeaf(node):
+            nonlocal counter
+            counter += 1
+            heapq.heappush(leaves, (node.f, -node.g, counter, node))
+
+        def isPrunable(node):
+            return node.alive and node.children and all(not child.children for child in node.children)
+
+        def pushPrunable(node):
+            nonlocal counter
+            if isPrunable(node):
+                counter += 1
+                heapq.heappush(prunable, (-node.f, node.g, counter, node))
+
+        def backup(node):
+            # f of an inner node is the smallest f of its children, propagate changes to the root
+            while node is not None and node.children:
+                f = min(child.f for child in node.children)
+                if f == node.f:
+                    break
+                node.f = f
+                pushPrunable(node)
+                node = node.parent
+
+        estimate = self.resolveHeuristic(heuristic, startState, goalState)
+        root = _MemoryNode(startState, 0, estimate(startState), None)
+        pushLeaf(root)
+
+        used = 1
+        stats = {"maxNodes": maxNodes, "peakNodes": 1, "reExpansions": 0, "prunes": 0}
+        nodesExpanded = 0
+
+        while leaves:
+            f, _, _, node = heapq.heappop(leaves)
+
+            # stale entry
+            if not node.alive or node.children or f != node.f:
+                continue
+
+            # even the best leaf cannot be expanded within the budget
+            if f == infinity:
+                break
+
+            # if goal reached = done, no other leaf has a smaller f
+            if node.state == goalState:
+                path = []
+                while node is not None:
+                    path.append(node.state)
+                    node = node.parent
+                path.reverse()
+                return path, nodesExpanded, stats
+
+            # generate neighbors, but never straight back to the parent
+            parentState = node.parent.state if node.parent is not None else None
+            successors = [neighbor for neighbor in self.neighbors(node.state) if neighbor != parentState]
+
+            # memory full: prune the worst subtrees, but not the one the node itself is in
+            skipped = []
+            while used + len(successors) > maxNodes and prunable:
+                negF, _, _, candidate = heapq.heappop(prunable)
+                if not isPrunable(candidate) or -negF != candidate.f:
+                    continue
+                if candidate is node.parent:
+                    skipped.append(candidate)
+                    continue
+
+                for index, child in enumerate(candidate.children):
+                    child.alive = False
+                    if child.expandedBefore:
+                        candidate.forgotten |= 1 << index
+                    # stale queue entries may still point to it, keep only the bare node alive
+                    child.state = child.parent = None
+                used -= len(candidate.children)
+                # its f keeps the backed-up value of the forgotten children
+                candidate.children = []
+                stats["prunes"] += 1
+                pushLeaf(candidate)
+                if candidate.parent is not None:
+                    pushPrunable(candidate.parent)
+
+            for candidate in skipped:
+                pushPrunable(candidate)
+
+            if used + len(successors) > maxNodes or not successors:
+                # the node can never be expanded, so it can never lead to a solution
+                node.f = infinity
+                backup(node.parent)
+                continue
+
+            nodesExpanded += 1
+            if node.expandedBefore:
+                stats["reExpansions"] += 1
+            node.expandedBefore = True
+
+            # successors come in the same order every time, so forgotten indexes them
+            for index, neighbor in enumerate(successors):
+                child = _MemoryNode(neighbor, node.g + 1, estimate(neighbor), node)
+                # a child is never cheaper than its (backed-up) parent
+                child.f = max(child.f, node.f)
+                child.expandedBefore = bool(node.forgotten >> index & 1)
+                node.children.append(child)
+                pushLeaf(child)
+
+            node.forgotten = 0
+            used += len(successors)
+            stats["peakNodes"] = max(stats["peakNodes"], used)
+
+            backup(node)
+            pushPrunable(node)
+
+            # rebuild the queues once stale entries outnumber the nodes in memory
+            # (live entries are at most one per node, _memoryNodeBytes accounts for the slack)
+            if len(leaves) + len(prunable) > 2 * used + 64:
+                leaves = [e for e in leaves if e[3].alive and not e[3].children and e[0] == e[3].f]
+                prunable = [e for e in prunable if isPrunable(e[3]) and -e[0] == e[3].f]
+                heapq.heapify(leaves)
+                heapq.heapify(prunable)
+
+        return None, nodesExpanded, stats
+
+    def _memoryNodeBytes(self, state):
+        """
+        Estimate the memory solveMemoryBounded needs per node in its budget
+
+        Counts the node with its children list and board, its slot in the parent's children list,
+        its queue entry (tuple, counter and heap slot with list over-allocation) and the slack until
+        the queues are rebuilt: up to one stale entry per node, each keeping a pruned node (without
+        board) alive. Fixed interpreter overhead is not included: CPython keeps freed tuples on free
+        lists, which tracemalloc reports as up to ~300 KB regardless of the budget.
+        """
+        node = _MemoryNode(state, 0, 0, None)
+        children = []
+        for _ in range(3):
+            children.append(None)
+        queueEntry = sys.getsizeof((0, 0, 0, node)) + sys.getsizeof(2 ** 40) + 2 * 8
+        liveNode = (sys.getsizeof(node) + sys.getsizeof(children) + 8 + sys.getsizeof(state)
+                    + sum(sys.getsizeof(row) for row in state))
+        staleSlack = queueEntry + sys.getsizeof(node) + sys.getsizeof([])
+        return liveNode + queueEntry + staleSlack
+
+    def solveBatch(self, boards, heuristic):
+        """
+        Solve many boards one after another, e.g. straight from a CorpusReader
+
+        Parameters
+        boards: iterable of tuple[tuple[int]]
+            start board configurations (a CorpusReader is decoded lazily)
+        heuristic: string
+            name of a registered heuristic, e.g. "manhattan" or "hamming"
+
+        Returns: iterator of tuple[list[tuple[tuple[int]]], int]
+            path and nodesExpanded per board, in input order
+        """
+        if isinstance(boards, CorpusReader):
+            self._checkCorpus(boards)
+        for startState in boards:
+            yield self.solve(startState, self.goalState, heuristic)
+
+    def _checkCorpus(self, corpus):
+        """
+        helper to make sure a corpus was written for this solver's board size and goal
+        """
+        if corpus.size != self.size:
+            raise ValueError(f"Corpus has {corpus.size}x{corpus.size} boards, solver expects {self.size}x{self.size}.")
+        if corpus.goalState != self.goalState:
+            raise ValueError(f"Corpus goal {corpus.goalState} does not match solver goal {self.goalState}.")
 
     # run 100 random solvable states per heuristic, measure time & nodes, compute statistics
-    def runBenchmark(self):
+    def runBenchmark(self, corpusPath=None):
         """
         Run A* search on 100 random solvable boards for both heuristics
         and measure performance (runtime + memory effort)
 
+        Parameters
+        corpusPath: str or None
+            binary corpus file (see corpus.py) to take the boards from instead of generating them,
+            all boards of the file are used
+
         Returns: dict
             statistics for each heuristic (runtime and nodes expanded)
         """
@@ -240,14 +648,21 @@ class Solver:
 
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        with open("../results/memory_usage", "a") as mem_file, open("../results/run_times", "a") as run_file:
+        with CorpusReader(corpusPath) if corpusPath is not None else nullcontext() as corpus, \
+                open("../results/memory_usage", "a") as mem_file, open("../results/run_times", "a") as run_file:
+            if corpus is not None:
+                self._checkCorpus(corpus)
+                numTests = len(corpus)
+                if numTests == 0:
+                    raise ValueError(f"Corpus {corpusPath} contains no boards.")
+
             for heuristic in heuristics:
 
                 runtimes = []
                 nodesExpandedList = []
 
                 for i in range(numTests):
-                    startState = self.generateRandomSolvableBoard()
+                    startState = corpus[i] if corpus is not None else self.generateRandomSolvableBoard()
 
                     # get current time
                     start_time = time.time()
@@ -266,12 +681,12 @@ class Solver:
                 results[heuristic] = {
                     # average runtime
                     "mean_runtime": statistics.mean(runtimes),
-                    # standard deviation of runtime
-                    "standard_runtime": statistics.stdev(runtimes),
+                    # standard deviation of runtime (needs two runs)
+                    "standard_runtime": statistics.stdev(runtimes) if numTests > 1 else 0.0,
                     # average number of nodes expanded (memory effort)
                     "mean_nodes": statistics.mean(nodesExpandedList),
                     # standard deviation of nodes expanded
-                    "standard_nodes": statistics.stdev(nodesExpandedList)
+                    "standard_nodes": statistics.stdev(nodesExpandedList) if numTests > 1 else 0.0
                 }
 
                 # write results to files
@@ -282,6 +697,81 @@ class Solver:
 
         return results
 
+
+    # run memory-bounded search at several budgets, measure peak memory & re-expansion cost
+    def runMemoryBoundedBenchmark(self, budgets=(10000, 2000, 500), heuristic="manhattan", numTests=20):
+        """
+        Run memory-bounded A* on the same random solvable boards at several node budgets,
+        next to unbounded A* as baseline, and measure peak memory and re-expansion cost
+
+        Parameters
+        budgets: tuple[int]
+            node budgets passed to solveMemoryBounded as maxNodes
+        heuristic: string
+            name of a registered heuristic, e.g. "manhattan" or "hamming"
+        numTests: int
+            number of random boards
+
+        Returns: dict
+            statistics per budget ("unbounded" for plain A*): mean runtime, mean nodes expanded,
+            mean re-expansions, mean peak traced memory in bytes and number of boards solved optimally
+        """
+        boards = [self.generateRandomSolvableBoard() for _ in range(numTests)]
+        results = {}
+
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        # optimal lengths from plain A*, which also serves as the baseline
+        optimalLengths = []
+        for budget in ["unbounded"] + list(budgets):
+            runtimes = []
+            nodesExpandedList = []
+            reExpansionsList = []
+            peakMemoryList = []
+            solved = 0
+
+            for i, startState in enumerate(boards):
+                tracemalloc.start()
+                start_time = time.time()
+
+                if budget == "unbounded":
+                    path, nodesExpanded = self.solve(startState, self.goalState, heuristic)
+                    reExpansions = 0
+                    optimalLengths.append(len(path))
+                else:
+                    path, nodesExpanded, stats = self.solveMemoryBounded(startState, self.goalState, heuristic,
+                                                                         maxNodes=budget)
+                    reExpansions = stats["reExpansions"]
+
+                end_time = time.time()
+                _, peakMemory = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                runtimes.append(end_time - start_time)
+                nodesExpandedList.append(nodesExpanded)
+                reExpansionsList.append(reExpansions)
+                peakMemoryList.append(peakMemory)
+                if path is not None and len(path) == optimalLengths[i]:
+                    solved += 1
+
+            results[budget] = {
+                "mean_runtime": statistics.mean(runtimes),
+                "mean_nodes": statistics.mean(nodesExpandedList),
+                "mean_reexpansions": statistics.mean(reExpansionsList),
+                "mean_peak_memory": statistics.mean(peakMemoryList),
+                "solved_optimal": solved
+            }
+
+        with open("../results/memory_bounded", "a") as bounded_file:
+            for budget, res in results.items():
+                bounded_file.write(
+                    f"{timestamp} - Heuristic: {heuristic}, Budget: {budget}, Mean runtime: {res['mean_runtime']:.4f} s, "
+                    f"Mean nodes: {res['mean_nodes']:.2f}, Mean re-expansions: {res['mean_reexpansions']:.2f}, "
+                    f"Mean peak memory: {res['mean_peak_memory'] / 1024:.1f} KiB, "
+                    f"Optimal: {res['solved_optimal']}/{numTests}\n")
+
+        return results
+
 # TESTING
 if __name__ == "__main__":
 
@@ -321,4 +811,20 @@ if __name__ == "__main__":
     path, expanded = solver.solve(start, goal, "hamming")
     print(f"Hamming solved it in {len(path) - 1} moves (expanded {expanded} nodes)")
 
-    solver.runBenchmark()
\ No newline at end of file
+    print("Incremental Replanning Test")
+    path, expanded = solver.solve(start, goal, "manhattan", remember=True)
+    path, expanded, stats = solver.replan(path[1], goal, "manhattan", compareFresh=True)
+    print(f"On path: {len(path) - 1} moves, mode {stats['mode']}, saved {stats['savedExpansions']} expansions")
+    offPath = [n for n in solver.neighbors(start) if n != path[0]][0]
+    path, expanded, stats = solver.replan(offPath, goal, "manhattan", compareFresh=True)
+    print(f"Off path: {len(path) - 1} moves, mode {stats['mode']}, saved {stats['savedExpansions']} expansions\n")
+
+    print("Memory-Bounded A* Test")
+    for budget in [1000, 100]:
+        path, expanded, stats = solver.solveMemoryBounded(start, goal, "manhattan", maxNodes=budget)
+        print(f"Budget {budget}: {len(path) - 1} moves (expanded {expanded} nodes, "
+              f"peak {stats['peakNodes']} nodes, {stats['reExpansions']} re-expansions)")
+    print()
+
+    solver.runBenchmark()
+    solver.runMemoryBoundedBenchmark()
\ No newline at end of file